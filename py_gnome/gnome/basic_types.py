@@ -40,6 +40,8 @@ else:
     np_long = np.long
 
 mover_type = np.float64
+# positions must stay double precision -- the C++ movers and land-check
+# kernels operate on (long, lat, z) world points of this type
 world_point_type = np.float64
 windage_type = np.float64
 water_current_type = np.float64
@@ -591,11 +591,12 @@ class ParamMap(GnomeMap):
                                                 self._refloat_halflife)
             rnd = np.random.uniform(0, 1, len(r_idx))
 
-            # subset of indices that will refloat
+            # subset of indices that will refloat -- index straight with
+            # the boolean mask, no need for an extra np.where pass
             # maybe we should rename refloat_probability since
             # rnd <= refloat_probability to
             # refloat, maybe call it stay_on_land_probability
-            r_idx = r_idx[np.where(rnd <= refloat_probability)[0]]
+            r_idx = r_idx[rnd <= refloat_probability]
         elif self._refloat_halflife < 0.0:
             # fake for nothing gets refloated.
             r_idx = np.array((), np.bool)
@@ -946,11 +947,12 @@ class RasterMap(GnomeMap):
                                                 self._refloat_halflife)
             rnd = np.random.uniform(0, 1, len(r_idx))
 
-            # subset of indices that will refloat
+            # subset of indices that will refloat -- index straight with
+            # the boolean mask, no need for an extra np.where pass
             # maybe we should rename refloat_probability since
             # rnd <= refloat_probability to
             # refloat, maybe call it stay_on_land_probability
-            r_idx = r_idx[np.where(rnd <= refloat_probability)[0]]
+            r_idx = r_idx[rnd <= refloat_probability]
         elif self._refloat_halflife < 0.0:
             # fake for nothing gets refloated.
             r_idx = np.array((), np.bool)
@@ -6,6 +6,8 @@ import copy
 import inspect
 import zipfile
 
+import numpy as np
+
 from colander import (SchemaNode,
                       String, Float, Int, Bool,
                       drop, OneOf)
@@ -13,11 +15,12 @@ from colander import (SchemaNode,
 from gnome.environment import Environment
 
 import gnome.utilities.cache
+from gnome.utilities._move_kernels import accumulate_moves, HAS_NUMBA
 from gnome.utilities.time_utils import round_time
 from gnome.utilities.orderedcollection import OrderedCollection
 from gnome.utilities.serializable import Serializable, Field
 
-from gnome.basic_types import oil_status, fate
+from gnome.basic_types import oil_status, fate, world_point_type
 from gnome.spill_container import SpillContainerPair
 from gnome.environment import Wind
 from gnome.movers import Mover
@@ -269,6 +272,9 @@ class Model(Serializable):
         self._cache = gnome.utilities.cache.ElementCache()
         self._cache.enabled = cache_enabled
 
+        # scratch buffers for the mover deltas, keyed by sc.uncertain
+        self._deltas_buffers = {}
+
         # list of output objects
         self.outputters = OrderedCollection(dtype=Outputter)
 
@@ -296,6 +302,8 @@ class Model(Serializable):
 
         # reset _current_time_step
         self._current_time_step = -1
+        self._elapsed_seconds = 0
+        self._model_time = None
         self._time_step = None
         if time_step is not None:
             self.time_step = time_step  # this calls rewind() !
@@ -320,7 +328,11 @@ class Model(Serializable):
         Rewinds the model to the beginning (start_time)
         '''
         self._current_time_step = -1
-        self.model_time = self._start_time
+        self._elapsed_seconds = 0
+        self._model_time = None
+
+        # the spill containers get rebuilt, so drop the delta buffers
+        self._deltas_buffers = {}
 
         # fixme: do the movers need re-setting? -- or wait for
         #        prepare_for_model_run?
@@ -428,10 +440,24 @@ class Model(Serializable):
 
     @current_time_step.setter
     def current_time_step(self, step):
-        self.model_time = self._start_time + timedelta(seconds=step *
-                                                       self.time_step)
+        # advancing a step just bumps the integer-seconds counter --
+        # model_time is derived from it lazily, on the first read
+        self._elapsed_seconds = step * self._time_step
+        self._model_time = None
         self._current_time_step = step
 
+    @property
+    def model_time(self):
+        '''
+        The current model time, derived lazily from the start time plus
+        the elapsed-seconds counter
+        '''
+        if self._model_time is None:
+            self._model_time = self._start_time + \
+                timedelta(seconds=self._elapsed_seconds)
+
+        return self._model_time
+
     @property
     def duration(self):
         '''
@@ -694,21 +720,27 @@ class Model(Serializable):
         '''
         sets up everything for the current time_step:
         '''
+        # every object gets the same time step, model time and spill
+        # containers -- look them up once
+        time_step = self.time_step
+        model_time = self.model_time
+        spills = self.spills.items()
+
         # initialize movers differently if model uncertainty is on
         for m in self.movers:
-            for sc in self.spills.items():
-                m.prepare_for_model_step(sc, self.time_step, self.model_time)
+            for sc in spills:
+                m.prepare_for_model_step(sc, time_step, model_time)
 
         for w in self.weatherers:
-            for sc in self.spills.items():
+            for sc in spills:
                 # maybe we will setup a super-sampling step here???
-                w.prepare_for_model_step(sc, self.time_step, self.model_time)
+                w.prepare_for_model_step(sc, time_step, model_time)
 
         for environment in self.environment:
-            environment.prepare_for_model_step(self.model_time)
+            environment.prepare_for_model_step(model_time)
 
         for outputter in self.outputters:
-            outputter.prepare_for_model_step(self.time_step, self.model_time)
+            outputter.prepare_for_model_step(time_step, model_time)
 
     def move_elements(self):
         '''
@@ -718,30 +750,85 @@ class Model(Serializable):
          - calls the beaching code to beach the elements that need beaching.
          - sets the new position
         '''
+        time_step = self.time_step
+        model_time = self.model_time
+
         for sc in self.spills.items():
             if sc.num_released > 0:  # can this check be removed?
 
                 # possibly refloat elements
-                self.map.refloat_elements(sc, self.time_step)
-
-                # reset next_positions
-                (sc['next_positions'])[:] = sc['positions']
-
-                # loop through the movers
-                for m in self.movers:
-                    delta = m.get_move(sc, self.time_step, self.model_time)
-                    sc['next_positions'] += delta
+                self.map.refloat_elements(sc, time_step)
+
+                # bind the arrays once -- everything below works on the
+                # same buffers, so no need to go through __getitem__ again
+                positions = sc['positions']
+                next_positions = sc['next_positions']
+
+                if HAS_NUMBA:
+                    # collect the deltas from all the movers, then apply
+                    # them along with the reset of next_positions in a
+                    # single fused pass over the position arrays
+                    deltas = self._get_deltas_buffer(sc, len(self.movers))
+                    for ix, m in enumerate(self.movers):
+                        # bind the row once -- indexing deltas[ix] again
+                        # would make a new view object, breaking the
+                        # identity test below
+                        row = deltas[ix]
+                        delta = m.get_move(sc, time_step, model_time,
+                                           out=row)
+                        if delta is not row:
+                            # the mover couldn't write in place
+                            row[...] = delta
+
+                    accumulate_moves(positions, next_positions, deltas)
+                else:
+                    # without numba, staging the deltas would only add a
+                    # copy per mover -- accumulate them in place instead,
+                    # with one reused scratch row for the in-place movers
+                    scratch = self._get_deltas_buffer(sc, 1)[0]
+                    np.copyto(next_positions, positions)
+                    for m in self.movers:
+                        np.add(next_positions,
+                               m.get_move(sc, time_step, model_time,
+                                          out=scratch),
+                               out=next_positions)
 
                 self.map.beach_elements(sc)
 
                 # let model mark these particles to be removed
-                tbr_mask = sc['status_codes'] == oil_status.off_maps
-                sc['status_codes'][tbr_mask] = oil_status.to_be_removed
+                status_codes = sc['status_codes']
+                tbr_mask = status_codes == oil_status.off_maps
+                status_codes[tbr_mask] = oil_status.to_be_removed
 
                 self._update_fate_status(sc)
 
-                # the final move to the new positions
-                (sc['positions'])[:] = sc['next_positions']
+                # the final move to the new positions: swap the two
+                # buffers rather than copying the whole array --
+                # next_positions is completely rewritten by
+                # accumulate_moves each step, so the stale contents are
+                # never read
+                sc['positions'] = next_positions
+                sc['next_positions'] = positions
+
+    def _get_deltas_buffer(self, sc, num_movers):
+        '''
+        The (num_movers, num_elements, 3) scratch array the mover deltas
+        for a spill container get collected into.
+
+        The buffers are kept across time steps -- one per certain and
+        uncertain container -- and only reallocated when the number of
+        movers or released elements changes.
+        '''
+        shape = (num_movers, sc.num_released, 3)
+        deltas = self._deltas_buffers.get(sc.uncertain)
+
+        if deltas is None or deltas.shape != shape:
+            # same dtype as the position arrays -- the movers hand back
+            # world points, and accumulating them must not downcast
+            deltas = np.empty(shape, dtype=world_point_type)
+            self._deltas_buffers[sc.uncertain] = deltas
+
+        return deltas
 
     def _update_fate_status(self, sc):
         '''
@@ -906,12 +993,16 @@ class Model(Serializable):
         #    self.model_time + self.time_step
         # This is the current_time_stamp attribute of the SpillContainer
         #     [sc.current_time_stamp for sc in self.spills.items()]
+        # model_time reflects the just-incremented current_time_step
+        time_step = self.time_step
+        model_time = self.model_time
+
         for sc in self.spills.items():
-            sc.current_time_stamp = self.model_time
+            sc.current_time_stamp = model_time
 
             # release particles for next step - these particles will be aged
             # in the next step
-            num_released = sc.release_elements(self.time_step, self.model_time)
+            num_released = sc.release_elements(time_step, model_time)
 
             # initialize data - currently only weatherers do this so cycle
             # over weatherers collection - in future, maybe movers can also do
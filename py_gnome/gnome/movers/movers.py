@@ -181,7 +181,7 @@ class Process(AddLogger):
 
 
 class Mover(Process):
-    def get_move(self, sc, time_step, model_time_datetime):
+    def get_move(self, sc, time_step, model_time_datetime, out=None):
         """
         Compute the move in (long,lat,z) space. It returns the delta move
         for each element of the spill as a numpy array of size
@@ -195,14 +195,19 @@ class Mover(Process):
         :param sc: an instance of gnome.spill_container.SpillContainer class
         :param time_step: time step in seconds
         :param model_time_datetime: current model time as datetime object
+        :param out=None: an (num_elements, 3) array to write the delta
+                         into, so the caller can reuse one buffer across
+                         steps. Movers that can't write in place may
+                         ignore it -- the model checks whether the
+                         returned array is the one it passed in.
 
         All movers must implement get_move() since that's what the model calls
         """
-        positions = sc['positions']
-        delta = np.zeros_like(positions)
-        delta[:] = np.nan
+        if out is None:
+            out = np.zeros_like(sc['positions'])
+        out[:] = np.nan
 
-        return delta
+        return out
 
 class PyMover(Mover):
 
@@ -315,7 +320,7 @@ class CyMover(Mover):
                 self.logger.error(msg)
                 raise RuntimeError(msg)
 
-    def get_move(self, sc, time_step, model_time_datetime):
+    def get_move(self, sc, time_step, model_time_datetime, out=None):
         """
         Base implementation of Cython wrapped C++ movers
         Override for things like the WindMover since it has a different
@@ -324,8 +329,11 @@ class CyMover(Mover):
         :param sc: spill_container.SpillContainer object
         :param time_step: time step in seconds
         :param model_time_datetime: current model time as datetime object
+        :param out=None: an (num_elements, 3) array to write the delta
+                         into -- the cython mover then computes straight
+                         into the caller's buffer
         """
-        self.prepare_data_for_get_move(sc, model_time_datetime)
+        self.prepare_data_for_get_move(sc, model_time_datetime, out)
 
         # only call get_move if mover is active, it is on and there are LEs
         # that have been released
@@ -335,16 +343,23 @@ class CyMover(Mover):
                                 self.positions, self.delta,
                                 self.status_codes, self.spill_type)
 
+        if out is not None:
+            # the delta was computed straight into the caller's buffer
+            # -- hand the same object back so the caller can tell
+            return out
+
         return self.delta.view(dtype=world_point_type).reshape((-1,
                 len(world_point)))
 
-    def prepare_data_for_get_move(self, sc, model_time_datetime):
+    def prepare_data_for_get_move(self, sc, model_time_datetime, out=None):
         """
         organizes the spill object into inputs for calling with Cython
         wrapper's get_move(...)
 
         :param sc: an instance of gnome.spill_container.SpillContainer class
         :param model_time_datetime: current model time as datetime object
+        :param out=None: an (num_elements, 3) array to use as the delta
+                         buffer, instead of allocating a fresh one
         """
         self.model_time = self.datetime_to_seconds(model_time_datetime)
 
@@ -366,8 +381,17 @@ class CyMover(Mover):
         self.positions = \
             self.positions.view(dtype=world_point).reshape(
                                                     (len(self.positions),))
-        self.delta = np.zeros(len(self.positions),
-                              dtype=world_point)
+
+        if out is None:
+            self.delta = np.zeros(len(self.positions),
+                                  dtype=world_point)
+        else:
+            # the cython movers only fill in the elements they move, so
+            # the caller's buffer has to start out zeroed, just like a
+            # freshly allocated one
+            out[...] = 0.0
+            self.delta = out.view(dtype=world_point).reshape(
+                                                    (len(self.positions),))
 
     def model_step_is_done(self, sc=None):
         """
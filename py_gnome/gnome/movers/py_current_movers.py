@@ -89,7 +89,8 @@ class PyGridCurrentMover(movers.PyMover, serializable.Serializable):
 
         return vels
 
-    def get_move(self, sc, time_step, model_time_datetime, num_method=None):
+    def get_move(self, sc, time_step, model_time_datetime, num_method=None,
+                 out=None):
         """
         Compute the move in (long,lat,z) space. It returns the delta move
         for each element of the spill as a numpy array of size
@@ -106,7 +106,7 @@ class IceAwareRandomMover(RandomMover):
                                                         time=time,
                                                         grid=grid)
         return cls(ice_conc_var=ice_conc_var, **kwargs)
-    def get_move(self, sc, time_step, model_time_datetime):
+    def get_move(self, sc, time_step, model_time_datetime, out=None):
         status = sc['status_codes'] != oil_status.in_water
         positions = sc['positions']
         deltas = np.zeros_like(positions)
@@ -116,7 +116,7 @@ class IceAwareRandomMover(RandomMover):
         if len(np.where(interp_mask)[0]) != 0:
             ice_mask = interp >= 0.8
 
-            deltas = super(IceAwareRandomMover,self).get_move(sc, time_step, model_time_datetime)
+            deltas = super(IceAwareRandomMover,self).get_move(sc, time_step, model_time_datetime, out=out)
             interp -= 0.2
             interp *= 1.25
             interp *= 1.3333333333
@@ -126,7 +126,7 @@ class IceAwareRandomMover(RandomMover):
             deltas[status] = (0, 0, 0)
             return deltas
         else:
-            return super(IceAwareRandomMover,self).get_move(sc, time_step, model_time_datetime)
+            return super(IceAwareRandomMover,self).get_move(sc, time_step, model_time_datetime, out=out)
 
 
 
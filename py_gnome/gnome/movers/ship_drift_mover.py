@@ -196,7 +196,7 @@ class ShipDriftMover(Mover, serializable.Serializable):
         self.delta = np.zeros(len(self.positions),
                               dtype=world_point)
 
-    def get_move(self, sc, time_step, model_time_datetime):
+    def get_move(self, sc, time_step, model_time_datetime, out=None):
         """
         Override base class functionality because mover has a different
         get_move signature
@@ -205,6 +205,9 @@ class ShipDriftMover(Mover, serializable.Serializable):
         :param time_step: time step in seconds
         :param model_time_datetime: current time of the model as a date time
                                     object
+        :param out=None: accepted for signature compatibility -- this
+                         mover builds its delta through a projection, so
+                         it always returns a fresh array
         """
         self.prepare_data_for_get_move(sc, model_time_datetime)
         #will need to override get_move using grid's get_values
@@ -90,6 +90,7 @@ class SimpleMover(Mover, serializable.Serializable):
         spill,
         time_step,
         model_time,
+        out=None,
         ):
         """
         moves the particles defined in the spill object
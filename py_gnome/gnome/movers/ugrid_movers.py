@@ -62,7 +62,7 @@ class UGridCurrentMover(movers.Mover, serializable.Serializable):
 
         return vels
 
-    def get_move(self, sc, time_step, model_time_datetime):
+    def get_move(self, sc, time_step, model_time_datetime, out=None):
         """
         Compute the move in (long,lat,z) space. It returns the delta move
         for each element of the spill as a numpy array of size
@@ -81,6 +81,7 @@ class RiseVelocityMover(CyMover, serializable.Serializable):
         sc,
         time_step,
         model_time_datetime,
+        out=None,
         ):
         """
         Override base class functionality because mover has a different
@@ -90,9 +91,11 @@ class RiseVelocityMover(CyMover, serializable.Serializable):
         :param time_step: time step in seconds
         :param model_time_datetime: current time of the model as a date time
             object
+        :param out=None: an (num_elements, 3) array to write the delta
+            into, instead of allocating a fresh one
         """
 
-        self.prepare_data_for_get_move(sc, model_time_datetime)
+        self.prepare_data_for_get_move(sc, model_time_datetime, out)
 
         if self.active and len(self.positions) > 0:
             self.mover.get_move(self.model_time,
@@ -104,5 +107,9 @@ class RiseVelocityMover(CyMover, serializable.Serializable):
                 self.spill_type,
                 )
 
+        if out is not None:
+            # the delta was computed straight into the caller's buffer
+            return out
+
         return self.delta.view(dtype=world_point_type).reshape((-1,
                 len(world_point)))
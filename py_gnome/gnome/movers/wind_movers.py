@@ -159,7 +159,7 @@ class WindMoversBase(CyMover):
                                      sc['windage_persist'],
                                      time_step)
 
-    def get_move(self, sc, time_step, model_time_datetime):
+    def get_move(self, sc, time_step, model_time_datetime, out=None):
         """
         Override base class functionality because mover has a different
         get_move signature
@@ -168,8 +168,10 @@ class WindMoversBase(CyMover):
         :param time_step: time step in seconds
         :param model_time_datetime: current time of the model as a date time
                                     object
+        :param out=None: an (num_elements, 3) array to write the delta
+                         into, instead of allocating a fresh one
         """
-        self.prepare_data_for_get_move(sc, model_time_datetime)
+        self.prepare_data_for_get_move(sc, model_time_datetime, out)
 
         if self.active and len(self.positions) > 0:
             self.mover.get_move(self.model_time,
@@ -180,6 +182,10 @@ class WindMoversBase(CyMover):
                                 self.status_codes,
                                 self.spill_type)
 
+        if out is not None:
+            # the delta was computed straight into the caller's buffer
+            return out
+
         return (self.delta.view(dtype=world_point_type)
                 .reshape((-1, len(world_point))))
 
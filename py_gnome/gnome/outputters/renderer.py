@@ -200,6 +200,11 @@ class Renderer(Outputter, MapCanvas):
         else:
             self.land_polygons = []  # empty list so we can loop thru it
 
+        # cache of the land polygons projected to pixel coordinates,
+        # along with the viewport/image size they were projected for
+        self._projected_land = None
+        self._projected_land_key = None
+
         self.last_filename = ''
         self.draw_ontop = draw_ontop
         self.draw_back_to_fore = draw_back_to_fore
@@ -468,33 +473,71 @@ class Renderer(Outputter, MapCanvas):
 #                     self.draw_points(
 #                         grid.nodes[i], diameter=dia, color='black')
 
+    def _get_projected_land(self):
+        """
+        The land polygons projected to pixel coordinates.
+
+        The projected polygons are cached, keyed on the viewport and
+        image size, so redrawing the background of an unchanged view
+        does not re-project the whole map.
+        """
+        key = (tuple(map(tuple, self.viewport)),
+               tuple(self.image_size[:2]))
+
+        if self._projected_land_key != key:
+            self._projected_land = \
+                [(self.projection.to_pixel(poly.points, asint=True),
+                  self._classify_poly(poly.metadata))
+                 for poly in self.land_polygons]
+            self._projected_land_key = key
+
+        return self._projected_land
+
+    # integer tags for the types of land polygon in a BNA
+    _poly_land = 0
+    _poly_lake = 1
+    _poly_map_bounds = 2
+    _poly_spillable_area = 3
+
+    @staticmethod
+    def _classify_poly(metadata):
+        """
+        classify a land polygon from its BNA metadata, returning one of
+        the _poly_* integer tags -- the string parsing is done once here
+        rather than every time the land gets drawn
+        """
+        kind = metadata[1].strip().lower()
+
+        if kind == 'map bounds':
+            return Renderer._poly_map_bounds
+        elif kind.replace(' ', '') == 'spillablearea':
+            return Renderer._poly_spillable_area
+        elif metadata[2] == '2':
+            return Renderer._poly_lake
+        else:
+            return Renderer._poly_land
+
     def draw_land(self):
         """
         Draws the land map to the internal background image.
         """
-        for poly in self.land_polygons:
-            metadata = poly.metadata
-
-            if metadata[1].strip().lower() == 'map bounds':
+        for pixel_poly, poly_type in self._get_projected_land():
+            if poly_type == self._poly_map_bounds:
                 if self.draw_map_bounds:
-                    self.draw_polygon(poly,
-                                      line_color='map_bounds',
-                                      fill_color=None,
-                                      line_width=2,
-                                      background=True)
-            elif metadata[1].strip().lower().replace(' ', '') == 'spillablearea':
+                    self.back_image.draw_polygon(pixel_poly,
+                                                 line_color='map_bounds',
+                                                 fill_color=None,
+                                                 line_width=2)
+            elif poly_type == self._poly_spillable_area:
                 if self.draw_spillable_area:
-                    self.draw_polygon(poly,
-                                      line_color='spillable_area',
-                                      fill_color=None,
-                                      line_width=2,
-                                      background=True)
-            elif metadata[2] == '2':
-                # this is a lake
-                self.draw_polygon(poly, fill_color='lake', background=True)
+                    self.back_image.draw_polygon(pixel_poly,
+                                                 line_color='spillable_area',
+                                                 fill_color=None,
+                                                 line_width=2)
+            elif poly_type == self._poly_lake:
+                self.back_image.draw_polygon(pixel_poly, fill_color='lake')
             else:
-                self.draw_polygon(poly,
-                                  fill_color='land', background=True)
+                self.back_image.draw_polygon(pixel_poly, fill_color='land')
 
         return None
 
@@ -513,21 +556,28 @@ class Renderer(Outputter, MapCanvas):
             else:
                 color = 'LE'
 
-            positions = sc['positions']
+            # project all the elements in one call -- the on-land split
+            # is then done on the already-projected pixel coordinates
+            pixel_pos = self.projection.to_pixel(sc['positions'], asint=True)
 
             # which ones are on land?
             on_land = sc['status_codes'] == oil_status.on_land
-            self.draw_points(positions[on_land],
-                             diameter=2,
-                             color='black',
-                             # color=color,
-                             shape="x")
-            # draw the four pixels for the elements not on land and
-            # not off the map
-            self.draw_points(positions[~on_land],
-                             diameter=2,
-                             color=color,
-                             shape="round")
+
+            if not on_land.any():
+                # the common case: nothing is beached, so draw all the
+                # elements in one call, with no boolean-index copies
+                self.fore_image.draw_dots(pixel_pos,
+                                          diameter=2,
+                                          color=color)
+            else:
+                self.fore_image.draw_xes(pixel_pos[on_land],
+                                         diameter=2,
+                                         color='black')
+                # draw the four pixels for the elements not on land and
+                # not off the map
+                self.fore_image.draw_dots(pixel_pos[~on_land],
+                                          diameter=2,
+                                          color=color)
 
     def draw_raster_map(self):
         """
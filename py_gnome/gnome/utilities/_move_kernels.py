@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Numerical kernels for the element-moving loop of the model.
+
+Accumulating the mover deltas into 'next_positions' is the hottest loop
+in a transport run: applied one mover at a time it makes a full
+read-modify-write pass over the positions arrays per mover. The kernel
+here fuses the reset of 'next_positions' with the accumulation of all
+the mover deltas, so the arrays are traversed only once per time step.
+
+accumulate_moves dispatches on the number of movers: the common small
+cases (no movers, a single mover) get straight-line specializations,
+everything else goes to the generic kernel.
+
+numba is used for the generic kernel if it is installed, but it is not
+a required dependency -- there is a plain numpy fallback with the same
+signature.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _accumulate_moves_generic(positions, next_positions, deltas_stack):
+        num_movers = deltas_stack.shape[0]
+        num_elements = positions.shape[0]
+
+        for i in prange(num_elements):
+            for d in range(3):
+                s = positions[i, d]
+                for m in range(num_movers):
+                    s += deltas_stack[m, i, d]
+                next_positions[i, d] = s
+else:
+    def _accumulate_moves_generic(positions, next_positions, deltas_stack):
+        # numpy fallback -- in-place adds, so no per-mover temporaries
+        np.copyto(next_positions, positions)
+        for delta in deltas_stack:
+            np.add(next_positions, delta, out=next_positions)
+
+
+def accumulate_moves(positions, next_positions, deltas_stack):
+    """
+    next_positions = positions + sum of the mover deltas
+
+    :param positions: (N, 3) array of current element positions
+    :param next_positions: (N, 3) array the result is written into
+    :param deltas_stack: (M, N, 3) array of deltas -- one row per mover
+
+    next_positions is fully overwritten -- its previous contents are
+    never read.
+    """
+    num_movers = deltas_stack.shape[0]
+
+    if num_movers == 0:
+        # no movers -- the elements stay put
+        np.copyto(next_positions, positions)
+    elif num_movers == 1:
+        # single mover -- one fused add, no accumulation loop
+        np.add(positions, deltas_stack[0], out=next_positions)
+    else:
+        _accumulate_moves_generic(positions, next_positions, deltas_stack)
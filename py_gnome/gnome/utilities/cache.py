@@ -10,6 +10,8 @@ import warnings
 import tempfile
 import shutil
 import copy
+import threading
+import Queue
 from multiprocessing import Lock
 
 import numpy
@@ -25,6 +27,11 @@ from gnome.spill_container import (SpillContainerData,
 
 _cache_dir = tempfile.mkdtemp()
 
+# the (queue, thread) pairs of all live background writers --
+# clean_up_cache drains them before deleting a cache dir, so an
+# asynchronous write can't land in a directory being removed
+_live_writers = []
+
 
 class CacheError(Exception):
     'Here so we can be sure the user knows the error is coming from here'
@@ -40,6 +47,11 @@ def clean_up_cache(dir_name=_cache_dir):
 
     raises a warning if there is problem deleting a particular directory
     """
+    # wait for any writer that may still be creating files in there
+    for (write_queue, write_thread) in list(_live_writers):
+        if write_thread.is_alive():
+            write_queue.join()
+
     try:
         shutil.rmtree(dir_name)
     except OSError:
@@ -62,6 +74,31 @@ import atexit
 atexit.register(clean_up_cache)
 
 
+def _write_worker(write_queue):
+    """
+    Target for the background cache-writer thread.
+
+    Pulls (filename, data) pairs off the queue and writes them out,
+    so saving a time step doesn't block the model on disk I/O.
+
+    A None on the queue is the shutdown sentinel -- the thread drains
+    everything queued before it and then exits.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            write_queue.task_done()
+            break
+
+        (filename, data) = item
+        try:
+            np.savez(filename, **data)
+        except Exception, excp:
+            warnings.warn('Problem writing cache file: %s' % repr(excp))
+        finally:
+            write_queue.task_done()
+
+
 class ElementCache(object):
     """
     Cache for element data -- i.e. the data associated with the particles.
@@ -93,12 +130,60 @@ class ElementCache(object):
 
         self.lock = Lock()
 
+        # the background writer -- started lazily on the first save
+        self._write_queue = None
+        self._write_thread = None
+
     def __del__(self):
         'Clear out the cache when this object is deleted'
+        self._stop_writer()
         with self.lock:
             if os.path.isdir(self._cache_dir):
                 shutil.rmtree(self._cache_dir)
 
+    def _start_writer(self):
+        'Start the background writer thread, if not already running'
+        if self._write_thread is None:
+            self._write_queue = Queue.Queue()
+            # note: the thread gets the queue, not the cache object --
+            #       it must not keep the cache alive (__del__ cleans up
+            #       the cache dir)
+            self._write_thread = threading.Thread(target=_write_worker,
+                                                  args=(self._write_queue,))
+            # daemon, so a lingering write can't hang interpreter exit
+            self._write_thread.daemon = True
+            self._write_thread.start()
+
+            # register it, so clean_up_cache can drain it at exit
+            _live_writers.append((self._write_queue, self._write_thread))
+
+    def _flush_writes(self):
+        'Block until all queued cache files have hit the disk'
+        if self._write_queue is not None:
+            self._write_queue.join()
+
+    def _stop_writer(self, timeout=10.0):
+        '''
+        Shut the background writer down, draining anything still queued.
+
+        The sentinel goes through the queue behind any pending writes,
+        and the thread itself is joined with a timeout -- joining the
+        queue could hang forever if the worker has been frozen at
+        interpreter shutdown.
+        '''
+        if self._write_thread is not None:
+            self._write_queue.put(None)
+            self._write_thread.join(timeout)
+
+            try:
+                _live_writers.remove((self._write_queue,
+                                      self._write_thread))
+            except ValueError:
+                pass
+
+            self._write_thread = None
+            self._write_queue = None
+
     def _make_filename(self, step_num, uncertain=False):
         """
         Returns a filename of the temp file generated from step_num
@@ -145,11 +230,13 @@ class ElementCache(object):
                 self.recent = {step_num: [data, None]}
 
             # write the data if enabled
-            # could be threaded -- data is a copy, so doesn't need to be
-            #                      re-used by anything
+            # handed off to the writer thread -- data is a copy, so it
+            # doesn't need to be re-used by anything, and the model can
+            # carry on computing the next step while the npz is written
             if self.enabled:
                 filename = self._make_filename(step_num, sc.uncertain)
-                np.savez(filename, **data)
+                self._start_writer()
+                self._write_queue.put((filename, data))
 
     def load_timestep(self, step_num):
         """
@@ -176,6 +263,8 @@ class ElementCache(object):
                         np.array(u_data_arrays['current_time_stamp'])
         except KeyError:
             # not in the recent dict: try to load from disk
+            # -- but first make sure any pending writes have landed
+            self._flush_writes()
             try:
                 data_arrays = \
                     dict(np.load(self._make_filename(step_num)))
@@ -251,6 +340,10 @@ class ElementCache(object):
 
     def rewind(self):
         'Rewinds the cache -- clearing out everything'
+        # don't pull the directory out from under an in-flight write --
+        # and reclaim the thread; a fresh one starts on the next save
+        self._stop_writer()
+
         # clean out the in-memory cache
         self.recent = {}
 
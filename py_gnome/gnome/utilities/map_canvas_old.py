@@ -68,6 +68,18 @@ class MapCanvas(object):
     palette = np.array([i[1] for i in colors_rgb],
                        dtype=np.uint8).reshape((-1, ))
 
+    # (x, y) pixel offsets for the five-pixel "X" drawn for on-land
+    # elements, and for the four-pixel square drawn for floating elements
+    offsets_X = np.array(((0, 0),
+                          (-1, -1),
+                          (-1, 1),
+                          (1, -1),
+                          (1, 1)), dtype=np.int32)
+    offsets_square = np.array(((0, 0),
+                               (0, 1),
+                               (1, 0),
+                               (1, 1)), dtype=np.int32)
+
     def __init__(self,
                  image_size,
                  land_polygons=None,
@@ -103,6 +115,7 @@ class MapCanvas(object):
         self.image_mode = kwargs.pop('image_mode', 'P')
 
         self.back_image = None
+        self._back_image_array = None
 
         self._land_polygons = land_polygons
         self.map_BB = kwargs.pop('map_BB', None)
@@ -245,9 +258,12 @@ class MapCanvas(object):
 
         if self.land_polygons:  # is there any land to draw?
 
-            # project the data:
+            # project the data -- asking for integer pixel coordinates
+            # directly, so there is no round/astype pass per polygon below
             polygons = self.land_polygons.Copy()
-            polygons.TransformData(self.projection.to_pixel_2D)
+            polygons.TransformData(lambda points:
+                                   self.projection.to_pixel(points,
+                                                            asint=True))
 
             drawer = ImageDraw.Draw(back_image)
 
@@ -258,21 +274,22 @@ class MapCanvas(object):
                     if self.draw_map_bounds:
 
                         # Draw the map bounds polygon
-                        poly = (np.round(p)
-                                .astype(np.int32)
-                                .reshape((-1,))
-                                .tolist())
+                        poly = p.reshape((-1,)).tolist()
                         drawer.polygon(poly, outline=self.colors['map_bounds'])
                 elif p.metadata[1].strip().lower() == 'spillablearea':
                     # don't draw the spillable area polygon
                     continue
                 elif p.metadata[2] == '2':
                     # this is a lake
-                    poly = np.round(p).astype(np.int32).reshape((-1,)).tolist()
+                    poly = p.reshape((-1,)).tolist()
                     drawer.polygon(poly, fill=self.colors['lake'])
                 else:
-                    poly = np.round(p).astype(np.int32).reshape((-1,)).tolist()
+                    poly = p.reshape((-1,)).tolist()
                     drawer.polygon(poly, fill=self.colors['land'])
+
+        # the cached array of the old background is no longer valid
+        self._back_image_array = None
+
         return None
 
     def draw_raster_map(self, fill=True, outline=False):
@@ -293,14 +310,14 @@ class MapCanvas(object):
                 for i in [float(i) for i in range(w)]:
                     # float, so we don't get pixel-rounding
                     coords = raster_map.projection.to_lonlat(((i, 0), (i, h)))
-                    coords = (self.projection.to_pixel_2D(coords)
+                    coords = (self.projection.to_pixel(coords)
                               .reshape((-1,)).tolist())
                     drawer.line(coords, fill=self.colors['raster_map_outline'])
                 # horizontal lines
                 for i in [float(i) for i in range(h)]:
                     # float, so we don't get pixel-rounding
                     coords = raster_map.projection.to_lonlat(((0, i), (w, i)))
-                    coords = (self.projection.to_pixel_2D(coords)
+                    coords = (self.projection.to_pixel(coords)
                               .reshape((-1,)).tolist())
                     drawer.line(coords, fill=self.colors['raster_map_outline'])
 
@@ -314,17 +331,24 @@ class MapCanvas(object):
                                                                     (i + 1, j),
                                                                     (i+1, j+1),
                                                                     (i, j+1)))
-                            rect = (self.projection.to_pixel_2D(rect)
+                            rect = (self.projection.to_pixel(rect)
                                     .reshape((-1,)).tolist())
                             drawer.polygon(rect,
                                            fill=self.colors['raster_map'])
 
+            # the cached array of the old background is no longer valid
+            self._back_image_array = None
+
     def create_foreground_image(self):
         self.fore_image_array = np.zeros((self.image_size[1],
                                           self.image_size[0]), np.uint8)
         self.fore_image = Image.fromarray(self.fore_image_array, mode='P')
         self.fore_image.putpalette(self.palette)
 
+        # cache the palette indices used every time elements are drawn
+        self._le_color = self.colors['LE']
+        self._unc_color = self.colors['uncert_LE']
+
     def add_back_to_fore(self):
         """
         adds the background image to the foreground
@@ -334,7 +358,12 @@ class MapCanvas(object):
         """
         if self.back_image is not None:
             # compose the foreground and background
-            self.fore_image_array[:] = np.asarray(self.back_image)
+            # converting the PIL image copies the whole frame, so hang on
+            # to the converted array until the background is redrawn
+            if self._back_image_array is None:
+                self._back_image_array = np.asarray(self.back_image,
+                                                    dtype=np.uint8)
+            self.fore_image_array[:] = self._back_image_array
 
     def draw_elements(self, sc):
         """
@@ -348,50 +377,65 @@ class MapCanvas(object):
         if sc.num_released > 0:  # nothing to draw if no elements
             arr = self.fore_image_array
             if sc.uncertain:
-                color = self.colors['uncert_LE']
+                color = self._unc_color
             else:
-                color = self.colors['LE']
+                color = self._le_color
 
             positions = sc['positions']
 
+            # project and cast to pixel indices up front -- the on-map
+            # masking and all the stamping then work on the much smaller
+            # int32 coordinates
             pixel_pos = self.projection.to_pixel(positions, asint=False)
+            ix = pixel_pos[:, 0].astype(np.int32)
+            iy = pixel_pos[:, 1].astype(np.int32)
+
+            # remove points that are off the view port, leaving room for
+            # the one-pixel offsets of the stamps
+            on_map = ((ix >= 1) & (iy >= 1) &
+                      (ix <= self.image_size[0] - 2) &
+                      (iy <= self.image_size[1] - 2))
 
-            # remove points that are off the view port
-            on_map = ((pixel_pos[:, 0] > 1) &
-                      (pixel_pos[:, 1] > 1) &
-                      (pixel_pos[:, 0] < self.image_size[0] - 2) &
-                      (pixel_pos[:, 1] < self.image_size[1] - 2))
-            pixel_pos = pixel_pos[on_map]
+            if not on_map.any():
+                # everything is off the view port -- nothing to stamp,
+                # so skip the masking and indexing passes entirely
+                return
+
+            ix = ix[on_map]
+            iy = iy[on_map]
+
+            # mask the status codes once -- boolean indexing makes a copy
+            status_codes = sc['status_codes'][on_map]
 
             # which ones are on land?
-            on_land = sc['status_codes'][on_map] == oil_status.on_land
+            on_land = status_codes == oil_status.on_land
+
+            if not on_land.any():
+                # the common case: nothing is beached, so there are no
+                # "X"s to stamp and no need to split the coordinates
+                off_map = status_codes == oil_status.off_maps
+                if off_map.any():
+                    ix = ix[~off_map]
+                    iy = iy[~off_map]
+
+                arr[(iy[:, None] + self.offsets_square[:, 1]).ravel(),
+                    (ix[:, None] + self.offsets_square[:, 0]).ravel()] = color
+                return
 
             # draw the five "X" pixels for the on_land elements
-            arr[pixel_pos[on_land, 1].astype(np.int32),
-                pixel_pos[on_land, 0].astype(np.int32)] = color
-            arr[(pixel_pos[on_land, 1] - 1).astype(np.int32),
-                (pixel_pos[on_land, 0] - 1).astype(np.int32)] = color
-            arr[(pixel_pos[on_land, 1] - 1).astype(np.int32),
-                (pixel_pos[on_land, 0] + 1).astype(np.int32)] = color
-            arr[(pixel_pos[on_land, 1] + 1).astype(np.int32),
-                (pixel_pos[on_land, 0] - 1).astype(np.int32)] = color
-            arr[(pixel_pos[on_land, 1] + 1).astype(np.int32),
-                (pixel_pos[on_land, 0] + 1).astype(np.int32)] = color
+            # note: long-lat backwards for array (vs image)
+            arr[(iy[on_land][:, None] + self.offsets_X[:, 1]).ravel(),
+                (ix[on_land][:, None] + self.offsets_X[:, 0]).ravel()] = color
 
             # draw the four pixels for the elements not on land and
             # not off the map
-            off_map = sc['status_codes'][on_map] == oil_status.off_maps
+            off_map = status_codes == oil_status.off_maps
             not_on_land = np.logical_and(~on_land, ~off_map)
 
-            # note: long-lat backwards for array (vs image)
-            arr[(pixel_pos[not_on_land, 1] - 0.5).astype(np.int32),
-                (pixel_pos[not_on_land, 0] - 0.5).astype(np.int32)] = color
-            arr[(pixel_pos[not_on_land, 1] - 0.5).astype(np.int32),
-                (pixel_pos[not_on_land, 0] + 0.5).astype(np.int32)] = color
-            arr[(pixel_pos[not_on_land, 1] + 0.5).astype(np.int32),
-                (pixel_pos[not_on_land, 0] - 0.5).astype(np.int32)] = color
-            arr[(pixel_pos[not_on_land, 1] + 0.5).astype(np.int32),
-                (pixel_pos[not_on_land, 0] + 0.5).astype(np.int32)] = color
+            arr[(iy[not_on_land][:, None] +
+                 self.offsets_square[:, 1]).ravel(),
+                (ix[not_on_land][:, None] +
+                 self.offsets_square[:, 0]).ravel()] = color
 
     def draw_cells(self, cells):
         """
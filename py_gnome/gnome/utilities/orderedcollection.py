@@ -41,6 +41,7 @@ class OrderedCollection(object):
         self._elems = elems[:]
         self._d_index = \
             {self._s_id(elem): idx for idx, elem in enumerate(self._elems)}
+        self._index_order = None
 
         self.callbacks = {}
 
@@ -51,6 +52,20 @@ class OrderedCollection(object):
         else:
             return str(id(elem))
 
+    @property
+    def _order(self):
+        '''
+        indices into self._elems in insertion order.
+
+        The model run loops iterate over the collections every time step
+        while mutation is rare, so the sorted index list is cached and
+        only rebuilt after an add/remove/replace.
+        '''
+        if self._index_order is None:
+            self._index_order = sorted(self._d_index.values())
+
+        return self._index_order
+
     def remake(self):
         '''
         remove None elements from self._elems and renumber the indices in
@@ -61,6 +76,8 @@ class OrderedCollection(object):
             for ix, elem in enumerate(self._elems):
                 self._d_index[self._s_id(elem)] = ix
 
+            self._index_order = None
+
     def get(self, ident):
         '''
         can get the object either by 'id' or by index in the order in which
@@ -68,7 +85,7 @@ class OrderedCollection(object):
         '''
         try:
             # ident is an index into list
-            idx = sorted(self._d_index.values())[ident]
+            idx = self._order[ident]
             return self._elems[idx]
         except TypeError:
             # ident is the 'id' string
@@ -82,6 +99,7 @@ class OrderedCollection(object):
             if l__id not in self._d_index.keys():
                 self._d_index[l__id] = len(self._elems)
                 self._elems.append(elem)
+                self._index_order = None
 
                 # fire add event only if elem is not already in the list
                 self.fire_event('add', elem)
@@ -117,6 +135,7 @@ class OrderedCollection(object):
         item = self[obj_id]
         self._elems[self._d_index[obj_id]] = None
         del self._d_index[obj_id]
+        self._index_order = None
 
         # fire remove event before removing from collection
         # let gc delete item if it is no longer referenced
@@ -152,6 +171,7 @@ class OrderedCollection(object):
         del self._d_index[l__key]
         self._elems[idx] = new_elem
         self._d_index[self._s_id(new_elem)] = idx
+        self._index_order = None
         self.fire_event('replace', new_elem)  # returns the newly added object
 
     def index(self, elem):
@@ -173,13 +193,13 @@ class OrderedCollection(object):
                 raise ValueError('{0} is not in OrderedCollection'
                                  .format(elem))
 
-        return sorted(self._d_index.values()).index(idx)
+        return self._order.index(idx)
 
     def __len__(self):
         return len(self._d_index.keys())
 
     def __iter__(self):
-        for i in sorted(self._d_index.values()):
+        for i in self._order:
             yield self._elems[i]
 
     def __contains__(self, elem):
@@ -316,6 +336,7 @@ class OrderedCollection(object):
         '''
         del self._elems[:]
         self._d_index.clear()
+        self._index_order = None
 
     def values(self):
         'return list of items contained in collection'
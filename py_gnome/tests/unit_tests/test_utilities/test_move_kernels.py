@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+"""
+unit tests for the move-accumulation kernels used by Model.move_elements
+
+designed to be run with py.test
+"""
+
+import numpy as np
+
+import pytest
+
+from gnome.utilities import _move_kernels
+from gnome.utilities._move_kernels import accumulate_moves, HAS_NUMBA
+
+
+def sample_arrays(num_movers, num_elements=10):
+    'positions, an uninitialized next_positions, and a delta stack'
+    np.random.seed(1)
+
+    positions = np.random.uniform(-180, 180, (num_elements, 3))
+    next_positions = np.empty_like(positions)
+    deltas_stack = np.random.uniform(-1, 1, (num_movers, num_elements, 3))
+
+    return positions, next_positions, deltas_stack
+
+
+def test_no_movers():
+    'zero movers: the elements should stay put'
+    positions, next_positions, deltas_stack = sample_arrays(0)
+
+    accumulate_moves(positions, next_positions, deltas_stack)
+
+    assert np.array_equal(next_positions, positions)
+
+
+def test_one_mover():
+    'a single mover: one add, no accumulation loop'
+    positions, next_positions, deltas_stack = sample_arrays(1)
+
+    accumulate_moves(positions, next_positions, deltas_stack)
+
+    assert np.allclose(next_positions, positions + deltas_stack[0])
+
+
+@pytest.mark.parametrize('num_movers', [2, 3, 7])
+def test_multiple_movers(num_movers):
+    'the generic kernel: positions plus the sum of all the deltas'
+    positions, next_positions, deltas_stack = sample_arrays(num_movers)
+
+    accumulate_moves(positions, next_positions, deltas_stack)
+
+    assert np.allclose(next_positions,
+                       positions + deltas_stack.sum(axis=0))
+
+
+def test_overwrites_stale_contents():
+    'next_positions must be fully rewritten, whatever was in it before'
+    positions, next_positions, deltas_stack = sample_arrays(2)
+    next_positions[:] = np.inf
+
+    accumulate_moves(positions, next_positions, deltas_stack)
+
+    assert np.all(np.isfinite(next_positions))
+
+
+def test_positions_unchanged():
+    'the input positions should never be modified'
+    positions, next_positions, deltas_stack = sample_arrays(3)
+    orig = positions.copy()
+
+    accumulate_moves(positions, next_positions, deltas_stack)
+
+    assert np.array_equal(positions, orig)
+
+
+@pytest.mark.skipif(not HAS_NUMBA, reason='numba is not installed')
+@pytest.mark.parametrize('num_movers', [2, 5])
+def test_numba_matches_fallback(num_movers):
+    'the jit kernel and the plain numpy loop must agree'
+    positions, next_positions, deltas_stack = sample_arrays(num_movers)
+
+    accumulate_moves(positions, next_positions, deltas_stack)
+
+    # the numpy fallback, spelled out
+    expected = positions.copy()
+    for delta in deltas_stack:
+        expected += delta
+
+    assert np.allclose(next_positions, expected)
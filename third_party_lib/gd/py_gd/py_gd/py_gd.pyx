@@ -120,11 +120,38 @@ cdef class Image:
         """
         Returns a numpy array object with a copy of the data
 
+        Note that the array is (height, width) in size, in
+        keeping with image storage standards (e.g. PIL)
+        """
+        return self.as_array()
+
+    @cython.boundscheck(False)
+    def as_array(self, out=None):
+        """
+        Returns a numpy array with a copy of the data
+
+        :param out=None: an array to copy the data into. Must be
+                         (height, width) in shape, np.uint8 and
+                         C-contiguous. If not provided, a new array is
+                         allocated -- passing the same array in every
+                         frame avoids the per-frame allocation.
+
+        A true zero-copy view is not possible: gd stores a paletted
+        image as one separately-allocated buffer per row, so there is
+        no single contiguous buffer to expose.
+
         Note that the array is (height, width) in size, in
         keeping with image storage standards (e.g. PIL)
         """
         cdef cnp.ndarray[cnp.uint8_t, ndim=2, mode='c'] arr
-        arr = np.zeros((self.height, self.width), dtype=np.uint8)
+        if out is None:
+            ## empty, not zeros -- every byte gets overwritten below
+            arr = np.empty((self.height, self.width), dtype=np.uint8)
+        else:
+            arr = out
+            if arr.shape[0] != self.height or arr.shape[1] != self.width:
+                raise ValueError("out array must be the same size as image")
+
         cdef unsigned int row
 
         ##copy the data, row by row
@@ -282,6 +309,34 @@ cdef class Image:
 
         return color_index
 
+    def add_colors(self, color_list):
+        """
+        add a list of colors to the Palette in one call
+
+        :param color_list: the colors to add
+        :type color_list: list of 2-tuples: ('color_name', (r, g, b))
+
+        :returns color_indexes: the indexes of the new colors
+
+        allocating the whole set at once saves a python call per color
+        when a canvas sets up its palette
+        """
+        cdef int color_index
+        indexes = []
+
+        for name, rgb in color_list:
+            if name in self.colors:
+                raise ValueError("%s already in the palette"%name)
+
+            color_index = gdImageColorAllocate (self._image, rgb[0], rgb[1], rgb[2])
+            if color_index == -1:
+                raise ValueError("there are no more colors available to allocate")
+            self.colors[name] = color_index
+            self.color_names.append(name)
+            indexes.append(color_index)
+
+        return indexes
+
     def get_color_names(self):
         """
         :returns color_names: a list of all color names in use
@@ -338,6 +393,103 @@ cdef class Image:
                          self._get_color_index(color)
                          )
 
+    @cython.boundscheck(False)
+    def draw_dots(self, points, int diameter=1, color='black'):
+        """
+        Draws a set of individual dots, all in the same color
+
+        :param points: the (x,y) coordinates of the dots
+        :type points: Nx2 array of integers (or something that can be turned into one)
+
+        :param diameter=1: diameter of the dots in pixels
+        :type diameter: integer
+
+        :param color: color of the dots
+        :type  color: color name or index
+
+        the whole set is drawn in a single call into the gd lib -- much
+        faster than looping over draw_pixel from python
+        """
+        cdef cnp.ndarray[int, ndim=2, mode='c'] points_arr
+        points_arr = np.asarray(points, dtype=np.int).reshape( (-1,2) )
+
+        cdef unsigned int i, n
+        cdef int x, y
+        cdef int c = self._get_color_index(color)
+        n = points_arr.shape[0]
+
+        if diameter == 1:
+            for i in range(n):
+                gdImageSetPixel(self._image,
+                                points_arr[i, 0], points_arr[i, 1],
+                                c)
+        elif diameter == 2:
+            # draw four pixels -- a tiny square
+            for i in range(n):
+                x = points_arr[i, 0]
+                y = points_arr[i, 1]
+                gdImageSetPixel(self._image, x,     y,     c)
+                gdImageSetPixel(self._image, x + 1, y,     c)
+                gdImageSetPixel(self._image, x,     y + 1, c)
+                gdImageSetPixel(self._image, x + 1, y + 1, c)
+        elif diameter > 2:
+            for i in range(n):
+                gdImageFilledArc(self._image,
+                                 points_arr[i, 0], points_arr[i, 1],
+                                 diameter, diameter,
+                                 0, 360,
+                                 c,
+                                 gdArc)
+        else:
+            raise ValueError("diameter must be an integer >= 1")
+
+    @cython.boundscheck(False)
+    def draw_xes(self, points, int diameter=2, color='black', int line_width=1):
+        """
+        Draws a set of X marks, all in the same color
+
+        :param points: the (x,y) coordinates of the centers of the Xes
+        :type points: Nx2 array of integers (or something that can be turned into one)
+
+        :param diameter=2: size of the X in pixels
+        :type diameter: integer
+
+        :param color: color of the Xes
+        :type  color: color name or index
+
+        :param line_width=1: width of line
+        :type line_width: integer
+        """
+        cdef cnp.ndarray[int, ndim=2, mode='c'] points_arr
+        points_arr = np.asarray(points, dtype=np.int).reshape( (-1,2) )
+
+        cdef unsigned int i, n
+        cdef int x, y, r
+        cdef int c = self._get_color_index(color)
+        n = points_arr.shape[0]
+
+        if diameter == 2:
+            # the five-pixel X: center plus the four diagonal neighbors
+            for i in range(n):
+                x = points_arr[i, 0]
+                y = points_arr[i, 1]
+                gdImageSetPixel(self._image, x,     y,     c)
+                gdImageSetPixel(self._image, x - 1, y - 1, c)
+                gdImageSetPixel(self._image, x - 1, y + 1, c)
+                gdImageSetPixel(self._image, x + 1, y - 1, c)
+                gdImageSetPixel(self._image, x + 1, y + 1, c)
+        elif diameter > 2:
+            r = diameter / 2
+            gdImageSetThickness(self._image, line_width)
+            for i in range(n):
+                x = points_arr[i, 0]
+                y = points_arr[i, 1]
+                gdImageLine(self._image, x - r, y - r, x + r, y + r, c)
+                gdImageLine(self._image, x - r, y + r, x + r, y - r, c)
+            gdImageSetThickness(self._image, 1)
+        else:
+            raise ValueError("diameter must be an integer >= 2")
+
     def draw_line(self, pt1, pt2, color, int line_width=1):
         """
         draw a line from pt1 to pt2